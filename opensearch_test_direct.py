@@ -5,20 +5,50 @@ Used to verify connection to OpenSearch and retrieve index and cluster informati
 """
 
 import os
+import io
 import sys
 import json
+import contextlib
+from dataclasses import dataclass
+import functools
+import ssl
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from opensearchpy import OpenSearch
 import warnings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Load environment variables from .env file
+load_dotenv()
+
 # Disable SSL warnings
 warnings.filterwarnings("ignore", message=".*SSL.*")
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Reuse one TLS context (without certificate verification) for all connections
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# Let the server return only the fields we print
+CLUSTER_HEALTH_FILTER = "status,number_of_nodes,active_shards"
+CLUSTER_STATS_FILTER = "cluster_name,status,indices.count,indices.shards.total,nodes.count"
 
+@dataclass(frozen=True, slots=True)
+class OpenSearchConfig:
+    """OpenSearch connection settings"""
+    host: str
+    username: str
+    password: str
+
+@functools.cache
 def get_opensearch_config():
     """Get OpenSearch configuration from environment variables"""
-    # Load environment variables from .env file
-    load_dotenv()
-    
     host = os.getenv("OPENSEARCH_HOST", "https://localhost:9200")
     username = os.getenv("OPENSEARCH_USERNAME")
     password = os.getenv("OPENSEARCH_PASSWORD")
@@ -29,49 +59,46 @@ def get_opensearch_config():
         print("Please ensure OPENSEARCH_USERNAME and OPENSEARCH_PASSWORD are set in environment variables")
         sys.exit(1)
     
-    return {
-        "host": host,
-        "username": username,
-        "password": password
-    }
+    return OpenSearchConfig(host=host, username=username, password=password)
 
 def create_client(config):
     """Create OpenSearch client"""
-    print(f"Connecting to OpenSearch server: {config['host']}")
+    print(f"Connecting to OpenSearch server: {config.host}")
     
     return OpenSearch(
-        hosts=[config['host']],
-        http_auth=(config['username'], config['password']),
-        verify_certs=False,
-        ssl_show_warn=False
+        hosts=[config.host],
+        http_auth=(config.username, config.password),
+        ssl_context=SSL_CONTEXT,
+        http_compress=True,
+        # One connection per concurrent check
+        pool_maxsize=3
     )
 
-def pretty_print_json(data):
-    """Format and print JSON data"""
-    if isinstance(data, str):
-        try:
-            # Try to parse JSON string
-            parsed = json.loads(data)
-            return json.dumps(parsed, indent=2, ensure_ascii=False)
-        except:
-            # If not valid JSON, return as is
-            return data
-    else:
-        # If it's a dictionary or list, format directly
-        return json.dumps(data, indent=2, ensure_ascii=False)
+def format_obj(data):
+    """Format a dictionary or list as indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
 
-def test_opensearch():
-    """Execute OpenSearch tests"""
+def run_checks():
+    """Execute OpenSearch checks and print the results"""
     try:
         # Get configuration and create client
         config = get_opensearch_config()
         client = create_client(config)
         
+        # The three checks are independent, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            health_future = executor.submit(client.cluster.health, level="cluster", filter_path=CLUSTER_HEALTH_FILTER)
+            # Only fetch key information, otherwise too much
+            stats_future = executor.submit(client.cluster.stats, filter_path=CLUSTER_STATS_FILTER)
+            indices_future = executor.submit(client.cat.indices, format="json")
+        
         # Test 1: Cluster health status
         print("\n===== Cluster Health Status =====")
         try:
-            health = client.cluster.health()
-            print(pretty_print_json(health))
+            health = health_future.result()
+            print(format_obj(health))
             print("Cluster health status check: Success ✓")
         except Exception as e:
             print(f"Cluster health status check: Failed ✗ - {e}")
@@ -79,19 +106,8 @@ def test_opensearch():
         # Test 2: Cluster statistics
         print("\n===== Cluster Statistics =====")
         try:
-            stats = client.cluster.stats()
-            # Only print key information, otherwise too much
-            if isinstance(stats, dict):
-                summary = {
-                    "cluster_name": stats.get("cluster_name"),
-                    "status": stats.get("status"),
-                    "indices_count": stats.get("indices", {}).get("count"),
-                    "shards_total": stats.get("indices", {}).get("shards", {}).get("total"),
-                    "nodes_count": stats.get("nodes", {}).get("count", {})
-                }
-                print(pretty_print_json(summary))
-            else:
-                print(pretty_print_json(stats))
+            stats = stats_future.result()
+            print(format_obj(stats))
             print("Cluster statistics check: Success ✓")
         except Exception as e:
             print(f"Cluster statistics check: Failed ✗ - {e}")
@@ -99,15 +115,15 @@ def test_opensearch():
         # Test 3: Index list
         print("\n===== Index List =====")
         try:
-            indices = client.cat.indices(format="json")
-            print(pretty_print_json(indices))
+            indices = indices_future.result()
+            print(format_obj(indices))
             print("Index list check: Success ✓")
         except Exception as e:
             print(f"Index list check: Failed ✗ - {e}")
             
         # Connection test summary
         print("\n===== Test Summary =====")
-        print("OpenSearch server: " + config['host'])
+        print("OpenSearch server: " + config.host)
         print("Connection status: Successfully connected to OpenSearch server")
         
     except Exception as e:
@@ -119,5 +135,16 @@ def test_opensearch():
         print("3. If server doesn't require SSL, try changing URL from https:// to http://")
         print("4. Verify username and password are correct")
 
+def test_opensearch():
+    """Execute OpenSearch tests"""
+    # Buffer the report and write it out with a single call
+    report = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(report):
+            run_checks()
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+
 if __name__ == "__main__":
     test_opensearch() 
\ No newline at end of file
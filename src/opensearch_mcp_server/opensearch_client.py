@@ -1,42 +1,210 @@
+import asyncio
+import functools
+import json
 import logging
 import os
+import ssl
+import urllib3
+from dataclasses import dataclass
 from dotenv import load_dotenv
-from opensearchpy import OpenSearch
+from opensearchpy import AIOHttpConnection, AsyncOpenSearch, JSONSerializer, OpenSearch, Urllib3HttpConnection
+from opensearchpy._async._extra_imports import aiohttp
+from opensearchpy._async.http_aiohttp import OpenSearchClientResponse
+from opensearchpy.exceptions import SerializationError
 import warnings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Disable SSL warnings
+warnings.filterwarnings("ignore", message=".*SSL.*",)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Certificates are not verified. A single context is shared by every connection
+# so it is built once and TLS sessions can be resumed.
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
+logger = logging.getLogger(__name__)
+
+# Default size of the HTTP connection pools. Concurrent tool calls beyond
+# this number would otherwise open (and then discard) fresh TLS connections.
+DEFAULT_POOL_MAXSIZE = 32
+
+# Seconds idle pooled connections are kept open. aiohttp defaults to 15, which
+# would close the connections pre-warmed at startup before traffic arrives.
+KEEPALIVE_TIMEOUT = 60
+
+
+@dataclass(frozen=True, slots=True)
+class OSConfig:
+    """OpenSearch connection settings."""
+    host: str
+    username: str
+    password: str
+    pool_maxsize: int
+
+
+@functools.cache
+def load_config() -> OSConfig:
+    """Load OpenSearch configuration from environment variables."""
+    config = OSConfig(
+        host=os.getenv("OPENSEARCH_HOST"),
+        username=os.getenv("OPENSEARCH_USERNAME"),
+        password=os.getenv("OPENSEARCH_PASSWORD"),
+        pool_maxsize=int(os.getenv("OPENSEARCH_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE))
+    )
+
+    if not all([config.username, config.password]):
+        logger.error("Missing required OpenSearch configuration. Please check environment variables:")
+        logger.error("OPENSEARCH_USERNAME and OPENSEARCH_PASSWORD are required")
+        raise ValueError("Missing required OpenSearch configuration")
+
+    return config
+
+
+def to_json(data) -> str:
+    """Serialize an OpenSearch response into a JSON string for a tool result."""
+    if orjson is not None:
+        # Responses may contain non-string keys, which json.dumps accepts too
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """JSONSerializer that encodes request bodies and decodes responses with orjson."""
+
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data):
+        # don't serialize strings
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(data, e)
+
+
+class KeepAliveAIOHttpConnection(AIOHttpConnection):
+    """AIOHttpConnection that keeps idle pooled connections open for KEEPALIVE_TIMEOUT seconds."""
+
+    async def _create_aiohttp_session(self):
+        # Copied from AIOHttpConnection._create_aiohttp_session in opensearch-py
+        # 3.2.0, with a longer connector keepalive. Needs opensearch-py 2.3.0 or
+        # later, which added _trust_env; keep in sync when raising the pin.
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            skip_auto_headers=("accept", "accept-encoding"),
+            auto_decompress=True,
+            loop=self.loop,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            response_class=OpenSearchClientResponse,
+            connector=aiohttp.TCPConnector(
+                limit=self._limit,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                use_dns_cache=True,
+                enable_cleanup_closed=True,
+                ssl=self._ssl_context,
+            ),
+            trust_env=self._trust_env,
+        )
+
+
 class OpenSearchClient:
-    
-    def __init__(self, logger=None):         
+
+    def __init__(self, logger=None, client_kwargs=None):
+        """
+        Initialize OpenSearchClient.
+
+        Args:
+            logger: Logger instance
+            client_kwargs: Optional extra keyword arguments passed to ``OpenSearch``
+        """
         self.logger = logger
-        self.os_client = self._create_opensearch_client()
-        
-    def _get_os_config(self):
-        """Get OpenSearch configuration from environment variables."""
-        # Load environment variables from .env file
-        load_dotenv()
-        config = {
-            "host": os.getenv("OPENSEARCH_HOST"),
-            "username": os.getenv("OPENSEARCH_USERNAME"),
-            "password": os.getenv("OPENSEARCH_PASSWORD")
-        }
-        
-        if not all([config["username"], config["password"]]):
-            self.logger.error("Missing required OpenSearch configuration. Please check environment variables:")
-            self.logger.error("OPENSEARCH_USERNAME and OPENSEARCH_PASSWORD are required")
-            raise ValueError("Missing required OpenSearch configuration")
-        
-        return config
+        self.client_kwargs = dict(client_kwargs or {})
+        if orjson is not None:
+            self.client_kwargs.setdefault("serializer", OrjsonSerializer())
+        self.os_async_client = self._create_async_opensearch_client()
+
+    @functools.cached_property
+    def os_client(self) -> OpenSearch:
+        """Synchronous OpenSearch client, created on first access (the tools only use the async one)."""
+        return self._create_opensearch_client()
 
     def _create_opensearch_client(self) -> OpenSearch:
         """Create and return an OpenSearch client using configuration from environment."""
-        config = self._get_os_config()
+        config = load_config()
 
-        # Disable SSL warnings
-        warnings.filterwarnings("ignore", message=".*SSL.*",)
+        client_kwargs = dict(self.client_kwargs)
+        client_kwargs.setdefault("connection_class", Urllib3HttpConnection)
+        client_kwargs.setdefault("pool_maxsize", config.pool_maxsize)
 
         return OpenSearch(
-            hosts=[config["host"]],
-            http_auth=(config["username"], config["password"]),
-            verify_certs=False,
-            ssl_show_warn=False
-        ) 
\ No newline at end of file
+            hosts=[config.host],
+            http_auth=(config.username, config.password),
+            ssl_context=_SSL_CTX,
+            http_compress=True,
+            **client_kwargs
+        )
+
+    def _create_async_opensearch_client(self) -> AsyncOpenSearch:
+        """Create and return an AsyncOpenSearch client using configuration from environment."""
+        config = load_config()
+
+        client_kwargs = dict(self.client_kwargs)
+        client_kwargs["connection_class"] = KeepAliveAIOHttpConnection
+        client_kwargs.setdefault("maxsize", client_kwargs.pop("pool_maxsize", config.pool_maxsize))
+
+        return AsyncOpenSearch(
+            hosts=[config.host],
+            http_auth=(config.username, config.password),
+            ssl_context=_SSL_CTX,
+            http_compress=True,
+            **client_kwargs
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_client() -> OpenSearchClient:
+    """
+    Return the process-wide OpenSearchClient.
+
+    The clients (and their connection pools) are created on first use and shared
+    by every caller afterwards, so TCP and TLS connections are reused across
+    tool calls instead of being opened per call.
+    """
+    return OpenSearchClient(logger)
+
+
+def get_opensearch_client() -> OpenSearch:
+    """Return the process-wide synchronous OpenSearch client."""
+    return _get_shared_client().os_client
+
+
+def get_async_opensearch_client() -> AsyncOpenSearch:
+    """Return the process-wide AsyncOpenSearch client."""
+    return _get_shared_client().os_async_client
+
+
+def get_shared_transport():
+    """
+    Return the transport of the process-wide AsyncOpenSearch client.
+
+    Tools that need low-level HTTP access should call ``perform_request`` on
+    this transport instead of opening their own connections, so every request
+    reuses the shared keep-alive connection pool.
+    """
+    return get_async_opensearch_client().transport
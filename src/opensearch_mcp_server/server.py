@@ -1,27 +1,93 @@
 #!/usr/bin/env python3
+import asyncio
+import atexit
 import logging
-import argparse
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+import uvicorn
 from fastmcp import FastMCP
+from opensearchpy import AIOHttpConnection
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows
+    uvloop = None
 from .tools.index import IndexTools
 from .tools.cluster import ClusterTools
 from .tools.document import DocumentTools
-from .opensearch_client import OpenSearchClient
+from .opensearch_client import get_async_opensearch_client, load_config
+
+# uvicorn settings shared by single- and multi-process runs
+UVICORN_OPTIONS = {
+    "loop": "uvloop" if uvloop is not None else "asyncio",
+    "http": "httptools",
+    # The MCP endpoint does not use websockets
+    "ws": "none",
+    "lifespan": "on",
+    "timeout_graceful_shutdown": 0,
+    # Absorb connection bursts and keep client connections warm between calls
+    "backlog": 2048,
+    "timeout_keep_alive": 75,
+    # Reject excess connections instead of piling load onto OpenSearch
+    "limit_concurrency": 1024,
+    # Per-request access logging is pure overhead on the MCP endpoint
+    "access_log": False,
+    "log_level": "warning",
+}
+
+def configure_logging():
+    """
+    Configure root logging to write to stderr from a background thread.
+
+    Log records are put on a queue and a QueueListener thread does the actual
+    write, so request handlers never block on stderr. Does nothing if logging
+    is already configured.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    # Thread and process details are not part of the log format
+    logging.logThreads = False
+    logging.logProcesses = False
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Flush queued records on exit
+    atexit.register(listener.stop)
+
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
 
 class OpenSearchMCPServer:
-    def __init__(self):
+    def __init__(self, stateless_http=False):
+        """
+        Initialize the OpenSearch MCP server.
+
+        Args:
+            stateless_http: Serve every request without a server-side MCP session
+        """
         self.name = "opensearch_mcp_server"
+        self.stateless_http = stateless_http
         
         # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        configure_logging()
         self.logger = logging.getLogger(self.name)
+        # opensearch-py logs every HTTP request at INFO; keep only problems
+        logging.getLogger("opensearch").setLevel(logging.WARNING)
         
         self.mcp = FastMCP(self.name)
+        self._app = None
 
-        # Initialize OpenSearch client
-        self.os_client = OpenSearchClient(self.logger).os_client
+        # Initialize the shared OpenSearch client. Tools run on the event loop,
+        # so they use the async client to avoid blocking it on network I/O.
+        self.os_client = get_async_opensearch_client()
         
         # Initialize tools
         self._register_tools()
@@ -32,14 +98,52 @@ class OpenSearchMCPServer:
         index_tools = IndexTools(self.logger, self.os_client)
         cluster_tools = ClusterTools(self.logger, self.os_client)
         document_tools = DocumentTools(self.logger, self.os_client)
+
+        # All tools must share a single keep-alive connection pool
+        tools = (index_tools, cluster_tools, document_tools)
+        transport = self.os_client.transport
+        assert all(t.os_client.transport is transport for t in tools)
+        assert issubclass(transport.connection_class, AIOHttpConnection)
         
         # Register tools from each module
         index_tools.register_tools(self.mcp)
         cluster_tools.register_tools(self.mcp)
         document_tools.register_tools(self.mcp)
         
+    def create_app(self):
+        """Create the ASGI app serving the MCP endpoint.
+
+        The app is built once and cached, so repeated calls return the same instance.
+        """
+        if self._app is None:
+            app = self.mcp.http_app(transport="streamable-http", stateless_http=self.stateless_http)
+            # Wrap the MCP session manager lifespan with our own
+            self._mcp_lifespan = app.router.lifespan_context
+            app.router.lifespan_context = self._lifespan
+            self._app = app
+        return self._app
+
+    @asynccontextmanager
+    async def _lifespan(self, app):
+        """Run the MCP app lifespan and manage OpenSearch connections.
+
+        On startup the connection pool is filled by concurrent pings, so the first
+        burst of tool calls does not pay for TCP and TLS handshakes. The aiohttp
+        session behind the async client is created by the first of them, bound to
+        the server's running event loop. Connections are closed on shutdown.
+        """
+        async with self._mcp_lifespan(app):
+            # Skip the warm-up if the cluster is unreachable
+            if await self.os_client.ping():
+                pool_size = load_config().pool_maxsize
+                await asyncio.gather(*(self.os_client.ping() for _ in range(pool_size - 1)))
+            try:
+                yield
+            finally:
+                await self.os_client.close()
+
     def run(self, host=None, port=None):
-        """Run the MCP server with SSE transport.
+        """Run the MCP server with streamable HTTP transport.
         
         Args:
             host: Optional host address, defaults to 127.0.0.1
@@ -48,16 +152,108 @@ class OpenSearchMCPServer:
         host = host or "127.0.0.1"
         port = port or 8000
         
-        self.logger.info(f"OpenSearch MCP service will start on {host}:{port}")
-        self.mcp.run(transport="streamable-http", host=host, port=port)
+        self.logger.info("OpenSearch MCP service will start on %s:%s", host, port)
+        config = uvicorn.Config(self.create_app(), host=host, port=port, **UVICORN_OPTIONS)
+        uvicorn.Server(config).run()
+
+def create_worker_app():
+    """
+    App factory run by each uvicorn worker process when serving with --workers.
+
+    Requests are balanced across processes, so an MCP session cannot be pinned
+    to the process that created it; workers therefore serve stateless HTTP.
+    """
+    return OpenSearchMCPServer(stateless_http=True).create_app()
+
+def run_workers(host, port, workers):
+    """Run the MCP server in multiple uvicorn worker processes.
+
+    Args:
+        host: Host address to listen on
+        port: Port number to listen on
+        workers: Number of worker processes
+    """
+    uvicorn.run(
+        f"{__name__}:create_worker_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        **UVICORN_OPTIONS,
+    )
+
+# Command line options: name -> (type, default, help)
+CLI_OPTIONS = {
+    "--host": (str, "127.0.0.1", "Service listening host (default: 127.0.0.1)"),
+    "--port": (int, 8000, "Service listening port (default: 8000)"),
+    "--workers": (int, 1, "Number of worker processes (default: 1)"),
+}
+
+def _usage():
+    metavars = " ".join(f"[{name} {name[2:].upper()}]" for name in CLI_OPTIONS)
+    return f"usage: opensearch-mcp-server [-h] {metavars}\n"
+
+def _usage_error(message):
+    sys.stderr.write(_usage())
+    sys.stderr.write(f"opensearch-mcp-server: error: {message}\n")
+    raise SystemExit(2)
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    A small hand-rolled parser: argparse is comparatively expensive to import
+    for the handful of options this server accepts. Both ``--opt value`` and
+    ``--opt=value`` forms are supported.
+
+    Args:
+        argv: Arguments to parse, defaults to sys.argv[1:]
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    options = {name[2:]: default for name, (_, default, _) in CLI_OPTIONS.items()}
+
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            rows = [("-h, --help", "show this help message and exit")]
+            rows += [(f"{name} {name[2:].upper()}", text) for name, (_, _, text) in CLI_OPTIONS.items()]
+            # Pad every option to the longest one, plus two spaces
+            width = max(len(label) for label, _ in rows) + 2
+            sys.stdout.write(_usage() + "\nOpenSearch MCP Server\n\noptions:\n")
+            sys.stdout.write("".join(f"  {label:<{width}}{text}\n" for label, text in rows))
+            raise SystemExit(0)
+
+        name, sep, value = arg.partition("=")
+        if name not in CLI_OPTIONS:
+            _usage_error(f"unrecognized arguments: {arg}")
+        if not sep:
+            value = next(args, None)
+            if value is None:
+                _usage_error(f"argument {name}: expected one argument")
+
+        value_type = CLI_OPTIONS[name][0]
+        try:
+            options[name[2:]] = value_type(value)
+        except ValueError:
+            _usage_error(f"argument {name}: invalid {value_type.__name__} value: '{value}'")
+
+    return SimpleNamespace(**options)
 
 def main():
     # Parse command line arguments
-    parser = argparse.ArgumentParser(description='OpenSearch MCP Server')
-    parser.add_argument('--host', type=str, default="127.0.0.1", help='Service listening host (default: 127.0.0.1)')
-    parser.add_argument('--port', type=int, default=8000, help='Service listening port (default: 8000)')
-    args = parser.parse_args()
+    args = parse_args()
     
+    if args.workers > 1:
+        # Validate the configuration once here: a worker failing on it would
+        # be restarted by uvicorn's supervisor forever
+        configure_logging()
+        try:
+            load_config()
+        except ValueError:
+            sys.exit(1)
+        run_workers(args.host, args.port, args.workers)
+        return
+
     # Create and run the server
     server = OpenSearchMCPServer()
     server.run(host=args.host, port=args.port)
\ No newline at end of file
@@ -1 +1,7 @@
-"""OpenSearch MCP Tools.""" 
\ No newline at end of file
+"""OpenSearch MCP Tools.
+
+Tools talk to OpenSearch only through the shared client passed to them (or
+``opensearch_client.get_shared_transport()`` for low-level requests). Do not
+issue HTTP requests directly, e.g. with ``requests``, as that bypasses the
+shared keep-alive connection pool.
+"""
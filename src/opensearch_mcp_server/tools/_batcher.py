@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List
+
+
+class AsyncBatcher:
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 16,
+        max_wait_ms: float = 10,
+    ):
+        """
+        Coalesce concurrent submissions into batches handled by a single call.
+
+        Items submitted within ``max_wait_ms`` of the first pending item (up to
+        ``max_batch`` of them) are passed together to ``process_batch``, which
+        must return one result per item, in order. A result that is an exception
+        instance is raised to that item's caller only.
+
+        Args:
+            process_batch: Coroutine function processing a list of items
+            max_batch: Maximum number of items per batch
+            max_wait_ms: Maximum time to wait for more items before dispatching
+        """
+        self.process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._loop = None
+        self._queue = None
+        self._worker = None
+        self._pending = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Submit an item and wait for its result."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker.done():
+            # Queue and worker are bound to the loop that first uses them
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect())
+
+        future = loop.create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _collect(self):
+        """Group queued items into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without blocking collection of the next batch
+            task = loop.create_task(self._dispatch(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _dispatch(self, batch):
+        """Process one batch and resolve each caller's future."""
+        try:
+            results = await self.process_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                # The caller went away (e.g. was cancelled)
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+        for _, future in batch[len(results):]:
+            if not future.done():
+                future.set_exception(RuntimeError("Batch returned fewer results than items"))
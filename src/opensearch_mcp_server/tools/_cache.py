@@ -0,0 +1,77 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+# Seconds cluster and index metadata responses are served from memory
+METADATA_CACHE_TTL = 5
+
+
+def _consume_exception(task: asyncio.Task):
+    if not task.cancelled():
+        task.exception()
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float = METADATA_CACHE_TTL, max_size: int = 256):
+        """
+        In-process cache-aside store for async loaders with a time-to-live.
+
+        Concurrent misses for the same key share a single in-flight load, and
+        failed loads are not cached.
+
+        Args:
+            ttl_seconds: How long a loaded value is served from memory
+            max_size: Maximum number of cached keys
+        """
+        self.ttl = ttl_seconds
+        self.max_size = max_size
+        self._values = {}
+        self._inflight = {}
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for key, loading it with load() on a miss.
+
+        Args:
+            key: Cache key
+            load: Coroutine function producing the value
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._values.get(key)
+        if entry is not None and entry[1] > loop.time():
+            return entry[0]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = loop.create_task(self._load(key, load))
+            # Retrieve a failure even if every waiter was cancelled, so asyncio
+            # does not log "Task exception was never retrieved"
+            task.add_done_callback(_consume_exception)
+            self._inflight[key] = task
+        # A cancelled caller must not cancel the load shared with other callers
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable):
+        """Drop the cached value for key, if any."""
+        self._values.pop(key, None)
+
+    async def _load(self, key, load):
+        try:
+            value = await load()
+        except Exception:
+            self.invalidate(key)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        self._store(key, value)
+        return value
+
+    def _store(self, key, value):
+        now = asyncio.get_running_loop().time()
+        if key not in self._values and len(self._values) >= self.max_size:
+            # Evict expired entries, then the oldest ones
+            for k in [k for k, (_, expires) in self._values.items() if expires <= now]:
+                del self._values[k]
+            while len(self._values) >= self.max_size:
+                del self._values[next(iter(self._values))]
+        self._values[key] = (value, now + self.ttl)
@@ -1,5 +1,7 @@
 import logging
 from typing import Dict, Any
+from ..opensearch_client import to_json
+from ._cache import TTLCache
 
 class ClusterTools:
     def __init__(self, logger=None, os_client=None):
@@ -8,10 +10,12 @@ class ClusterTools:
         
         Args:
             logger: Logger instance
-            os_client: OpenSearch client instance
+            os_client: AsyncOpenSearch client instance
         """
         self.logger = logger or logging.getLogger(__name__)
         self.os_client = os_client
+        # Metadata changes slowly, so repeated calls are served from memory briefly
+        self.cache = TTLCache()
         
     def register_tools(self, mcp: Any):
         """Register cluster-related tools."""
@@ -24,10 +28,10 @@ class ClusterTools:
             """
             self.logger.info("Getting cluster health")
             try:
-                response = self.os_client.cluster.health()
-                return str(response)
+                response = await self.cache.get("get_cluster_health", self.os_client.cluster.health)
+                return to_json(response)
             except Exception as e:
-                self.logger.error(f"Error getting cluster health: {e}")
+                self.logger.error("Error getting cluster health: %s", e)
                 return f"Error getting cluster health: {str(e)}"
 
         @mcp.tool(description="Get cluster statistics")
@@ -39,8 +43,8 @@ class ClusterTools:
             """
             self.logger.info("Getting cluster stats")
             try:
-                response = self.os_client.cluster.stats()
-                return str(response)
+                response = await self.cache.get("get_cluster_stats", self.os_client.cluster.stats)
+                return to_json(response)
             except Exception as e:
-                self.logger.error(f"Error getting cluster stats: {e}")
+                self.logger.error("Error getting cluster stats: %s", e)
                 return f"Error getting cluster stats: {str(e)}"
\ No newline at end of file
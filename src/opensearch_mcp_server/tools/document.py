@@ -1,5 +1,9 @@
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+from opensearchpy.exceptions import HTTP_EXCEPTIONS, TransportError
+from ..opensearch_client import to_json
+from ._batcher import AsyncBatcher
 
 class DocumentTools:
     def __init__(self, logger=None, os_client=None):
@@ -8,10 +12,54 @@ class DocumentTools:
         
         Args:
             logger: Logger instance
-            os_client: OpenSearch client instance
+            os_client: AsyncOpenSearch client instance
         """
         self.logger = logger or logging.getLogger(__name__)
         self.os_client = os_client
+        # Concurrent searches are coalesced into a single msearch request
+        self.search_batcher = AsyncBatcher(self._msearch)
+
+    async def _msearch(self, searches: List[Tuple[str, dict]]) -> List[Any]:
+        """
+        Run a batch of searches as one msearch request.
+
+        Args:
+            searches: List of (index, body) pairs
+
+        Returns:
+            One search response per pair, or the exception to raise for it
+        """
+        body = []
+        for index, query in searches:
+            body.append({"index": index})
+            body.append(query)
+        try:
+            response = await self.os_client.msearch(body=body)
+        except TransportError as e:
+            # OpenSearch rejects the whole msearch when any one body is
+            # malformed. Run the searches on their own so a bad query only
+            # fails its own caller. Connection errors have no HTTP status.
+            if len(searches) == 1 or not isinstance(e.status_code, int):
+                raise
+            self.logger.debug("msearch of %d searches failed, running them separately: %s", len(searches), e)
+            return await asyncio.gather(
+                *(self.os_client.search(index=index, body=query) for index, query in searches),
+                return_exceptions=True
+            )
+
+        results = []
+        for item in response["responses"]:
+            if "error" in item:
+                # Raise the same exception a standalone search would have
+                status = item.get("status", "N/A")
+                error = item["error"]
+                error_message = error.get("type", error) if isinstance(error, dict) else error
+                results.append(HTTP_EXCEPTIONS.get(status, TransportError)(status, error_message, item))
+            else:
+                # Match the response of a standalone search, which has no status
+                item.pop("status", None)
+                results.append(item)
+        return results
         
     def register_tools(self, mcp: Any):
         """Register document-related tools."""
@@ -25,11 +73,12 @@ class DocumentTools:
                 index: Name of the index to search
                 body: OpenSearch query DSL
             """
-            self.logger.info(f"Searching in index: {index} with query: {body}")
+            self.logger.info("Searching in index: %s", index)
+            self.logger.debug("Search query: %s", body)
             try:
-                response = self.os_client.search(index=index, body=body)
-                return str(response)
+                response = await self.search_batcher.submit((index, body))
+                return to_json(response)
             except Exception as e:
-                self.logger.error(f"Error searching documents: {e}")
+                self.logger.error("Error searching documents: %s", e)
                 return f"Error: {str(e)}"
                 
\ No newline at end of file
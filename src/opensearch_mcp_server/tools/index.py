@@ -1,5 +1,7 @@
 import logging
 from typing import Dict, Any
+from ..opensearch_client import to_json
+from ._cache import TTLCache
 
 class IndexTools:
     def __init__(self, logger=None, os_client=None):
@@ -8,10 +10,12 @@ class IndexTools:
         
         Args:
             logger: Logger instance
-            os_client: OpenSearch client instance
+            os_client: AsyncOpenSearch client instance
         """
         self.logger = logger or logging.getLogger(__name__)
         self.os_client = os_client
+        # Metadata changes slowly, so repeated calls are served from memory briefly
+        self.cache = TTLCache()
         
     def register_tools(self, mcp: Any):
         """Register index-related tools."""
@@ -21,10 +25,10 @@ class IndexTools:
             """List all indices in the OpenSearch cluster."""
             self.logger.info("Listing indices...")
             try:
-                indices = self.os_client.cat.indices(format="json")
-                return str(indices)
+                indices = await self.cache.get("list_indices", lambda: self.os_client.cat.indices(format="json"))
+                return to_json(indices)
             except Exception as e:
-                self.logger.error(f"Error listing indices: {e}")
+                self.logger.error("Error listing indices: %s", e)
                 return f"Error: {str(e)}"
 
         @mcp.tool(description="Get index mapping")
@@ -35,12 +39,12 @@ class IndexTools:
             Args:
                 index: Name of the index
             """
-            self.logger.info(f"Getting mapping for index: {index}")
+            self.logger.info("Getting mapping for index: %s", index)
             try:
-                response = self.os_client.indices.get_mapping(index=index)
-                return str(response)
+                response = await self.cache.get(("get_mapping", index), lambda: self.os_client.indices.get_mapping(index=index))
+                return to_json(response)
             except Exception as e:
-                self.logger.error(f"Error getting mapping: {e}")
+                self.logger.error("Error getting mapping: %s", e)
                 return f"Error: {str(e)}"
 
         @mcp.tool(description="Get index settings")
@@ -51,10 +55,10 @@ class IndexTools:
             Args:
                 index: Name of the index
             """
-            self.logger.info(f"Getting settings for index: {index}")
+            self.logger.info("Getting settings for index: %s", index)
             try:
-                response = self.os_client.indices.get_settings(index=index)
-                return str(response)
+                response = await self.cache.get(("get_settings", index), lambda: self.os_client.indices.get_settings(index=index))
+                return to_json(response)
             except Exception as e:
-                self.logger.error(f"Error getting settings: {e}")
+                self.logger.error("Error getting settings: %s", e)
                 return f"Error: {str(e)}"
\ No newline at end of file
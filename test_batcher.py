@@ -0,0 +1,146 @@
+import asyncio
+import pytest
+from opensearchpy.exceptions import ConnectionError, NotFoundError, RequestError, TransportError
+from opensearch_mcp_server.tools._batcher import AsyncBatcher
+from opensearch_mcp_server.tools.document import DocumentTools
+
+def make_batcher(process=None, **kwargs):
+    """Create an AsyncBatcher that records every batch it processes"""
+    batches = []
+
+    async def record(items):
+        batches.append(list(items))
+        if process is not None:
+            return await process(items)
+        return [item * 2 for item in items]
+
+    return AsyncBatcher(record, **kwargs), batches
+
+class FakeClient:
+    """Stands in for AsyncOpenSearch, returning (or raising) a canned msearch response"""
+
+    def __init__(self, response):
+        self.response = response
+        self.bodies = []
+        self.searches = []
+
+    async def msearch(self, body):
+        self.bodies.append(body)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+    async def search(self, index, body):
+        self.searches.append((index, body))
+        if "bad" in body:
+            raise RequestError(400, "parsing_exception", {})
+        return {"hits": {"index": index}}
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_batch():
+    batcher, batches = make_batcher()
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2, 3, 4]]
+
+@pytest.mark.asyncio
+async def test_max_batch_splits_batches():
+    batcher, batches = make_batcher(max_batch=2)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1], [2, 3], [4]]
+
+@pytest.mark.asyncio
+async def test_exception_result_goes_to_its_caller_only():
+    async def process(items):
+        return [ValueError(item) if item % 2 else item for item in items]
+
+    batcher, _ = make_batcher(process)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(4)), return_exceptions=True)
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError) and isinstance(results[3], ValueError)
+
+@pytest.mark.asyncio
+async def test_batch_failure_goes_to_every_caller():
+    # e.g. the cluster is unreachable; per-item errors are the processor's job
+    async def process(items):
+        raise RuntimeError("cluster unreachable")
+
+    batcher, _ = make_batcher(process)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_others():
+    release = asyncio.Event()
+
+    async def process(items):
+        await release.wait()
+        return [item * 2 for item in items]
+
+    batcher, batches = make_batcher(process)
+    tasks = [asyncio.create_task(batcher.submit(i)) for i in range(3)]
+    # Let the batch be collected and dispatched before cancelling
+    while not batches:
+        await asyncio.sleep(0.005)
+    tasks[1].cancel()
+    release.set()
+
+    assert await tasks[0] == 0
+    assert await tasks[2] == 4
+    with pytest.raises(asyncio.CancelledError):
+        await tasks[1]
+    # The batcher keeps serving later submissions
+    assert await batcher.submit(5) == 10
+
+@pytest.mark.asyncio
+async def test_msearch_maps_item_errors_to_exceptions():
+    client = FakeClient({"responses": [
+        {"hits": {"total": {"value": 1}}, "status": 200},
+        {"error": {"type": "index_not_found_exception"}, "status": 404},
+        {"error": "unexpected", "status": 599},
+    ]})
+    tools = DocumentTools(os_client=client)
+
+    results = await tools._msearch([("a", {"size": 1}), ("missing", {}), ("b", {})])
+
+    assert client.bodies == [[{"index": "a"}, {"size": 1}, {"index": "missing"}, {}, {"index": "b"}, {}]]
+    # Successful items look like a standalone search response
+    assert results[0] == {"hits": {"total": {"value": 1}}}
+    assert isinstance(results[1], NotFoundError)
+    assert results[1].status_code == 404
+    assert results[1].error == "index_not_found_exception"
+    assert type(results[2]) is TransportError
+    assert results[2].status_code == 599
+
+@pytest.mark.asyncio
+async def test_invalid_query_only_fails_its_own_search():
+    # OpenSearch rejects the whole msearch when one body cannot be parsed
+    client = FakeClient(RequestError(400, "parsing_exception", {}))
+    tools = DocumentTools(os_client=client)
+
+    results = await asyncio.gather(
+        tools.search_batcher.submit(("a", {"size": 1})),
+        tools.search_batcher.submit(("b", {"bad": {}})),
+        tools.search_batcher.submit(("c", {"size": 1})),
+        return_exceptions=True
+    )
+
+    assert len(client.bodies) == 1
+    assert results[0] == {"hits": {"index": "a"}}
+    assert isinstance(results[1], RequestError)
+    assert results[2] == {"hits": {"index": "c"}}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error, searches", [
+    # A single search already got its own error
+    (RequestError(400, "parsing_exception", {}), [("b", {"bad": {}})]),
+    # Retrying each search cannot help when the cluster is unreachable
+    (ConnectionError("N/A", "connection refused", None), [("a", {}), ("c", {})]),
+])
+async def test_msearch_errors_without_fallback(error, searches):
+    client = FakeClient(error)
+    tools = DocumentTools(os_client=client)
+    with pytest.raises(type(error)):
+        await tools._msearch(searches)
+    assert client.searches == []
@@ -0,0 +1,85 @@
+import asyncio
+import gc
+import pytest
+from opensearch_mcp_server.tools._cache import TTLCache
+
+def make_loader(*values):
+    """Create a loader returning (or raising) the given values in turn, counting its calls"""
+    calls = []
+
+    async def load():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        value = values[len(calls) - 1]
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    return load, calls
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    cache = TTLCache()
+    load, calls = make_loader("health")
+    results = await asyncio.gather(*(cache.get("key", load) for _ in range(5)))
+    assert results == ["health"] * 5
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_value_expires_after_ttl():
+    cache = TTLCache(ttl_seconds=0.05)
+    load, calls = make_loader("first", "second")
+    assert await cache.get("key", load) == "first"
+    assert await cache.get("key", load) == "first"
+    await asyncio.sleep(0.06)
+    assert await cache.get("key", load) == "second"
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_failed_load_is_not_cached():
+    cache = TTLCache()
+    load, calls = make_loader(RuntimeError("cluster down"), "health")
+    with pytest.raises(RuntimeError):
+        await cache.get("key", load)
+    assert await cache.get("key", load) == "health"
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_oldest_key_is_evicted_at_max_size():
+    cache = TTLCache(max_size=2)
+    for key in ("a", "b", "c"):
+        load, _ = make_loader(key)
+        await cache.get(key, load)
+
+    load, calls = make_loader("a again")
+    assert await cache.get("a", load) == "a again"
+    assert len(calls) == 1
+    load, calls = make_loader("unused")
+    assert await cache.get("c", load) == "c"
+    assert not calls
+
+@pytest.mark.asyncio
+async def test_failed_load_without_waiters_is_not_reported():
+    loop = asyncio.get_running_loop()
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        raise RuntimeError("cluster down")
+
+    cache = TTLCache()
+    waiter = asyncio.create_task(cache.get("key", load))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # The shared load fails after its only waiter went away
+    release.set()
+    while cache._inflight:
+        await asyncio.sleep(0)
+    del waiter
+    gc.collect()
+    assert errors == []
@@ -0,0 +1,37 @@
+import pytest
+from opensearch_mcp_server.server import CLI_OPTIONS, parse_args
+
+def test_defaults():
+    args = parse_args([])
+    assert (args.host, args.port, args.workers) == ("127.0.0.1", 8000, 1)
+
+def test_separate_and_inline_values():
+    args = parse_args(["--host", "0.0.0.0", "--port=9000", "--workers", "4"])
+    assert (args.host, args.port, args.workers) == ("0.0.0.0", 9000, 4)
+
+@pytest.mark.parametrize("argv, message", [
+    (["--port"], "argument --port: expected one argument"),
+    (["--port", "http"], "argument --port: invalid int value: 'http'"),
+    (["--workers=two"], "argument --workers: invalid int value: 'two'"),
+    (["--verbose"], "unrecognized arguments: --verbose"),
+])
+def test_invalid_arguments_exit_with_usage(argv, message, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args(argv)
+    assert exc_info.value.code == 2
+    err = capsys.readouterr().err
+    assert err.startswith("usage: opensearch-mcp-server")
+    assert err.endswith(f"error: {message}\n")
+
+@pytest.mark.parametrize("flag", ["-h", "--help"])
+def test_help_lists_every_option(flag, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args([flag])
+    assert exc_info.value.code == 0
+    lines = capsys.readouterr().out.splitlines()
+    for name, (_, _, text) in CLI_OPTIONS.items():
+        label = f"{name} {name[2:].upper()}"
+        line = next(line for line in lines if line.lstrip().startswith(label))
+        # Options and descriptions are separated by at least two spaces
+        assert line.endswith(text)
+        assert line[len(line) - len(text) - 2:len(line) - len(text)] == "  "